@@ -1,12 +1,100 @@
+import csv
 import math
+import tomllib
 from typing import Union
 
-import toml
-from pint import UnitRegistry
-from uncertainties import ufloat, umath
+import numpy as np
+from uncertainties import ufloat, unumpy
 
 from hx import colors, pintil
-from hx.fluids import Coolant
+from hx.fluids import Coolant, _friction_prefactor, _nusselt
+from hx.pintil import M_
+
+# Report label templates
+_LABEL = (
+    f"{colors.fg.blue}{{name}} {colors.fg.lightgreen}[{{sym}}] "
+    f"{colors.fg.darkgrey}::{colors.reset} "
+)
+_PLAIN_LABEL = f"{colors.fg.blue}{{name}} {colors.fg.darkgrey}::{colors.reset} "
+_HEADING = f"\n{colors.underline}{{}}{colors.reset}"
+_NO_SOLUTION = f"{colors.fg.red}No Solution{colors.reset}"
+
+
+def _ulog(value: float, error: float) -> tuple:
+    """Natural logarithm of an uncertain value with first order propagation.
+
+    Args:
+        value: Nominal value.
+        error: Standard deviation of the value.
+
+    Returns:
+        tuple: (value, error)
+    """
+
+    return math.log(value), abs(error / value)
+
+
+def _plate_performance(
+    plates,
+    max_velocity,
+    density,
+    viscosity,
+    conductivity,
+    prandtl,
+    dh,
+    corregation_angle,
+    energy_transfer,
+    lmtd,
+    plate_area,
+) -> tuple:
+    """Evaluate the heat exchanger over an array of plate counts.
+
+    All values are magnitudes in SI base units, as floats or ufloats. Coolant
+    properties are length 2 arrays holding the hot and cold coolant, so both
+    are evaluated by the same array expressions.
+
+    Args:
+        plates: Array of plate counts to evaluate.
+        max_velocity: Velocity of each coolant through a single channel.
+        density: Density of each coolant.
+        viscosity: Dynamic viscosity of each coolant.
+        conductivity: Thermal conductivity of each coolant.
+        prandtl: Prandtl number of each coolant.
+        dh: Hydraulic diameter of a channel.
+        corregation_angle: Corregation angle of the plates in degrees.
+        energy_transfer: Energy transferred between the coolants.
+        lmtd: Log mean temperature difference.
+        plate_area: Heat transfer area of a single plate.
+
+    Returns:
+        tuple: (plates required, hot velocity, cold velocity, hot reynolds,
+            cold reynolds, hot nusselt, cold nusselt, hot coefficient,
+            cold coefficient, u-value, required surface area)
+    """
+
+    # Reynolds -> Nusselt -> convective coefficient chain for both coolants
+    velocity = max_velocity[:, None] / plates
+    re = (density * dh / viscosity)[:, None] * velocity
+    nu = _nusselt(
+        re,
+        _friction_prefactor(corregation_angle),
+        prandtl[:, None],
+        (prandtl ** (2 / 3) - 1)[:, None],
+    )
+    h = (conductivity / dh)[:, None] * nu
+    u_value = 1 / (1 / h[0] + 1 / h[1])
+    required_surface_area = (energy_transfer / plates) / (u_value * lmtd)
+    plates_required = required_surface_area / plate_area
+
+    return (
+        plates_required,
+        *velocity,
+        *re,
+        *nu,
+        *h,
+        u_value,
+        required_surface_area,
+    )
 
 
 def lmtd_analysis(
@@ -15,22 +103,14 @@ def lmtd_analysis(
     cold_coolant: Coolant,
 ) -> None:
 
-    # Define pint utilities
-    ureg = UnitRegistry()
-    M_ = ureg.Measurement
-    Q_ = ureg.Quantity
+    # Preload data from parameters file
+    energy = M_(*pintil.mtargs(str(heat_exchanger["energy"])))
+    corregation_angle: float = float(heat_exchanger["corregation_angle"])
 
     # Calculate hot coolant temperatures
-    hot_mass_flow_rate = M_(
-        *pintil.mtargs(str(heat_exchanger["hot_mass_flow_rate"]))
-    ).to_root_units()
-    hot_coolant_delta_temperature = M_(
-        *pintil.mtargs(
-            hot_coolant.temperature_change(
-                "-" + str(heat_exchanger["energy"]),
-                f"{hot_mass_flow_rate:C}",
-            )
-        )
+    hot_mass_flow_rate = M_(*pintil.mtargs(str(heat_exchanger["hot_mass_flow_rate"])))
+    hot_coolant_delta_temperature = hot_coolant.temperature_change(
+        -energy, hot_mass_flow_rate
     )
     hot_coolant_inlet_temperature = M_(
         *pintil.mtargs(str(heat_exchanger["hot_inlet_temperature"]))
@@ -41,16 +121,9 @@ def lmtd_analysis(
     hot_coolant_delta_temperature = hot_coolant_delta_temperature.to("delta_degC")
 
     # Calculate cold coolant temperatures
-    cold_mass_flow_rate = M_(
-        *pintil.mtargs(str(heat_exchanger["cold_mass_flow_rate"]))
-    ).to_root_units()
-    cold_coolant_delta_temperature = M_(
-        *pintil.mtargs(
-            cold_coolant.temperature_change(
-                str(heat_exchanger["energy"]),
-                f"{cold_mass_flow_rate:C}",
-            )
-        )
+    cold_mass_flow_rate = M_(*pintil.mtargs(str(heat_exchanger["cold_mass_flow_rate"])))
+    cold_coolant_delta_temperature = cold_coolant.temperature_change(
+        energy, cold_mass_flow_rate
     )
     cold_coolant_inlet_temperature = M_(
         *pintil.mtargs(str(heat_exchanger["cold_inlet_temperature"]))
@@ -63,11 +136,9 @@ def lmtd_analysis(
     # Calculate log mean temperature difference
     delta_t1 = hot_coolant_inlet_temperature - cold_coolant_inlet_temperature
     delta_t2 = hot_coolant_outlet_temperature - cold_coolant_outlet_temperature
-    lmtd_cf = (delta_t1 - delta_t2) / umath.log(  # type: ignore
-        ufloat(
-            (delta_t1 / delta_t2).value.magnitude,
-            (delta_t1 / delta_t2).error.magnitude,
-        )
+    delta_t_ratio = delta_t1 / delta_t2
+    lmtd_cf = (delta_t1 - delta_t2) / ufloat(
+        *_ulog(delta_t_ratio.value.magnitude, delta_t_ratio.error.magnitude)
     )
 
     # Calculate heat exchanger dimensions
@@ -85,357 +156,323 @@ def lmtd_analysis(
     hydraulic_diameter = 4 * channel_area / (2 * plate_width + 2 * channel_width)
 
     # Calculate fluid velocity
-    max_hot_fluid_velocity = (
-        hot_mass_flow_rate
-        / M_(*pintil.mtargs(hot_coolant.density)).to_root_units()
-        / channel_area
+    hot_rho = pintil.wrap(hot_coolant.rho, "kg/m**3")
+    cold_rho = pintil.wrap(cold_coolant.rho, "kg/m**3")
+    max_hot_fluid_velocity = hot_mass_flow_rate / hot_rho / channel_area
+    max_cold_fluid_velocity = cold_mass_flow_rate / cold_rho / channel_area
+
+    # Stack hot and cold coolant properties as SI magnitudes
+    coolants = (hot_coolant, cold_coolant)
+    max_velocity = np.array(
+        [
+            max_hot_fluid_velocity.to_base_units().magnitude,
+            max_cold_fluid_velocity.to_base_units().magnitude,
+        ]
     )
-    max_cold_fluid_velocity = (
-        cold_mass_flow_rate
-        / M_(*pintil.mtargs(cold_coolant.density)).to_root_units()
-        / channel_area
+    density, viscosity, conductivity, prandtl = (
+        np.array([getattr(coolant, prop) for coolant in coolants])
+        for prop in ("rho", "mu", "k", "pr")
     )
+    dh = hydraulic_diameter.to_base_units().magnitude
+    energy_transfer = energy.to_base_units().magnitude
+    lmtd = lmtd_cf.to_base_units().magnitude
+    plate_area = (2 * plate_surface_area).to_base_units().magnitude
 
-    # Create csv file for data logging
-    with open("data/results.csv", "w") as csvfile:
-        csvfile.write(
-            "P_used, P_req, V_hot, V_cold, Re_hot, Re_cold, Nu_hot, Nu_cold, h_hot [W/(m*°C)], h_cold [W/(m*°C)], U [W/(m*°C)]\n",
-        )
+    # Limit the sweep to plate counts that keep both coolants turbulent,
+    # since the Reynolds number falls with each plate added
+    max_reynolds_number = unumpy.nominal_values(
+        density * max_velocity * dh / viscosity
+    ).min()
+    plates = np.arange(
+        1,
+        min(
+            int(heat_exchanger["plate_max_count"]),
+            math.ceil(max_reynolds_number / 1000),
+        ),
+    )
 
-    # Preload data from parameters file
-    energy = M_(*pintil.mtargs(str(heat_exchanger["energy"]))).to_root_units()
-    corregation_angle: float = float(heat_exchanger["corregation_angle"])
+    # Evaluate every plate count in a single pass
+    performance = _plate_performance(
+        plates,
+        max_velocity,
+        density,
+        viscosity,
+        conductivity,
+        prandtl,
+        dh,
+        corregation_angle,
+        energy_transfer,
+        lmtd,
+        plate_area,
+    )
 
-    # Determine plate count based on defined parameters
-    solution_identified = False
-    for plates_used in range(1, int(heat_exchanger["plate_max_count"])):
-        hot_fluid_velocity = max_hot_fluid_velocity / plates_used
-        cold_fluid_velocity = max_cold_fluid_velocity / plates_used
-
-        hot_reynolds_number = M_(
-            *pintil.mtargs(
-                hot_coolant.reynolds_number(
-                    f"{hot_fluid_velocity:C}",
-                    f"{hydraulic_diameter:C}",
-                )
+    # Log the sweep to a csv file in a single write
+    with open("data/results.csv", "w", buffering=1 << 20, newline="") as csvfile:
+        writer = csv.writer(csvfile, lineterminator="\n")
+        writer.writerow(
+            (
+                "P_used",
+                "P_req",
+                "V_hot",
+                "V_cold",
+                "Re_hot",
+                "Re_cold",
+                "Nu_hot",
+                "Nu_cold",
+                "h_hot [W/(m*°C)]",
+                "h_cold [W/(m*°C)]",
+                "U [W/(m*°C)]",
             )
         )
-        cold_reynolds_number = M_(
-            *pintil.mtargs(
-                cold_coolant.reynolds_number(
-                    f"{cold_fluid_velocity:C}",
-                    f"{hydraulic_diameter:C}",
-                )
+        writer.writerows(
+            (plates_used, p_req, v_hot, v_cold, *(f"{x:.0f}" for x in rounded), u)
+            for plates_used, p_req, v_hot, v_cold, *rounded, u, _ in zip(
+                plates, *performance
             )
         )
 
-        hot_nusselt_number = M_(
-            *pintil.mtargs(
-                hot_coolant.nusselt_number(
-                    f"{hot_reynolds_number:C}",
-                    corregation_angle,
-                )
-            )
+    # Determine plate count based on defined parameters
+    max_plates_required = np.ceil(
+        unumpy.nominal_values(performance[0]) + unumpy.std_devs(performance[0])
+    )
+    solutions = np.flatnonzero(plates >= max_plates_required)
+    if solutions.size:
+        plates_used = plates[solutions[0]]
+        (
+            plates_required,
+            hot_fluid_velocity,
+            cold_fluid_velocity,
+            hot_reynolds_number,
+            cold_reynolds_number,
+            hot_nusselt_number,
+            cold_nusselt_number,
+            hot_convective_heat_transfer_coefficient,
+            cold_convective_heat_transfer_coefficient,
+            u_value,
+            required_surface_area,
+        ) = (values[solutions[0]] for values in performance)
+
+        print(_HEADING.format(f"Hot Coolant :: {hot_coolant.name}"))
+        pintil.mprint(
+            _LABEL.format(name="Inlet Temperature", sym="Ti"),
+            hot_coolant_inlet_temperature,
+            ".3fP~",
         )
-        cold_nusselt_number = M_(
-            *pintil.mtargs(
-                cold_coolant.nusselt_number(
-                    f"{cold_reynolds_number:C}",
-                    corregation_angle,
-                )
-            )
+        pintil.mprint(
+            _LABEL.format(name="Outlet Temperature", sym="To"),
+            hot_coolant_outlet_temperature,
+            ".3fP~",
         )
-
-        hot_convective_heat_transfer_coefficient = M_(
-            *pintil.mtargs(
-                hot_coolant.convective_coefficient(
-                    f"{hot_nusselt_number:C}",
-                    f"{hydraulic_diameter:C}",
-                )
-            )
+        pintil.mprint(
+            _LABEL.format(name="Delta Temperature", sym="ΔT"),
+            hot_coolant_delta_temperature,
+            ".3fP~",
         )
-        cold_convective_heat_transfer_coefficient = M_(
-            *pintil.mtargs(
-                cold_coolant.convective_coefficient(
-                    f"{cold_nusselt_number:C}",
-                    f"{hydraulic_diameter:C}",
-                )
-            )
+        pintil.mprint(
+            _LABEL.format(name="Max Velocity", sym="Vmax"),
+            max_hot_fluid_velocity,
+            ".3fP~",
         )
-
-        try:
-            u_value = (
-                1 / hot_convective_heat_transfer_coefficient
-                + 1 / cold_convective_heat_transfer_coefficient
-            ).to("m**2*degC/W")
-        except ZeroDivisionError:
-            break
-        u_value = 1 / u_value
-        required_surface_area = (energy / plates_used) / (
-            u_value.to_root_units() * lmtd_cf.to_root_units()
-        )
-        plates_required = required_surface_area / (2 * plate_surface_area)
-        max_plates_required = math.ceil(
-            plates_required.value.magnitude + plates_required.error.magnitude
-        )
-
-        with open("data/results.csv", "a", newline="\n") as csvfile:
-            csvfile.write(
-                "{p_used}, {p_req}, {v_hot}, {v_cold}, {re_hot:.0f}, {re_cold:.0f}, {nu_hot:.0f}, {nu_cold:.0f}, {h_hot:.0f}, {h_cold:.0f}, {u}\n".format(
-                    p_used=plates_used,
-                    p_req=plates_required.magnitude,
-                    v_hot=hot_fluid_velocity.magnitude,
-                    v_cold=cold_fluid_velocity.magnitude,
-                    re_hot=hot_reynolds_number.magnitude,
-                    re_cold=cold_reynolds_number.magnitude,
-                    nu_hot=hot_nusselt_number.magnitude,
-                    nu_cold=cold_nusselt_number.magnitude,
-                    h_hot=hot_convective_heat_transfer_coefficient.magnitude,
-                    h_cold=cold_convective_heat_transfer_coefficient.magnitude,
-                    u=u_value.magnitude,
-                )
-            )
-
-        if plates_used >= max_plates_required and not solution_identified:
-            solution_identified = True
-            print(
-                f"\n{colors.underline}Hot Coolant :: {hot_coolant.name}{colors.reset}",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Inlet Temperature {colors.fg.lightgreen}[Ti] {colors.fg.darkgrey}::{colors.reset} ",
-                hot_coolant_inlet_temperature,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Outlet Temperature {colors.fg.lightgreen}[To] {colors.fg.darkgrey}::{colors.reset} ",
-                hot_coolant_outlet_temperature,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Delta Temperature {colors.fg.lightgreen}[ΔT] {colors.fg.darkgrey}::{colors.reset} ",
-                hot_coolant_delta_temperature,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Max Velocity {colors.fg.lightgreen}[Vmax] {colors.fg.darkgrey}::{colors.reset} ",
-                max_hot_fluid_velocity,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Channel Velocity {colors.fg.lightgreen}[V] {colors.fg.darkgrey}::{colors.reset} ",
-                hot_fluid_velocity,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Reynolds Number {colors.fg.lightgreen}[Re] {colors.fg.darkgrey}::{colors.reset}",
-                hot_reynolds_number,
-                ".0fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Nusselt Number {colors.fg.lightgreen}[Nu] {colors.fg.darkgrey}::{colors.reset}",
-                hot_nusselt_number,
-                ".0fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Convective Coefficient {colors.fg.lightgreen}[h] {colors.fg.darkgrey}::{colors.reset} ",
-                hot_convective_heat_transfer_coefficient,
-                ".0fP~",
-            )
-            print(
-                f"\n{colors.underline}Cold Coolant :: {cold_coolant.name}{colors.reset}",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Inlet Temperature {colors.fg.lightgreen}[Ti] {colors.fg.darkgrey}::{colors.reset} ",
-                cold_coolant_inlet_temperature,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Outlet Temperature {colors.fg.lightgreen}[To] {colors.fg.darkgrey}::{colors.reset} ",
-                cold_coolant_outlet_temperature,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Delta Temperature {colors.fg.lightgreen}[ΔT] {colors.fg.darkgrey}::{colors.reset} ",
-                cold_coolant_delta_temperature,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Max Velocity {colors.fg.lightgreen}[Vmax] {colors.fg.darkgrey}::{colors.reset} ",
-                max_cold_fluid_velocity,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Channel Velocity {colors.fg.lightgreen}[V] {colors.fg.darkgrey}::{colors.reset} ",
-                cold_fluid_velocity,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Reynolds Number {colors.fg.lightgreen}[Re] {colors.fg.darkgrey}::{colors.reset}",
-                cold_reynolds_number,
-                ".0fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Nusselt Number {colors.fg.lightgreen}[Nu] {colors.fg.darkgrey}::{colors.reset}",
-                cold_nusselt_number,
-                ".0fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Convective Coefficient {colors.fg.lightgreen}[h] {colors.fg.darkgrey}::{colors.reset} ",
-                cold_convective_heat_transfer_coefficient,
-                ".0fP~",
-            )
-            print(
-                f"\n{colors.underline}Heat Exchanger :: {heat_exchanger.get('name')}{colors.reset}",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Energy Transfer {colors.fg.lightgreen}[Q] {colors.fg.darkgrey}::{colors.reset} ",
-                energy.to("kW"),
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}LMTD {colors.fg.darkgrey}::{colors.reset} ",
-                lmtd_cf,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Channel Width {colors.fg.lightgreen}[Wc] {colors.fg.darkgrey}::{colors.reset} ",
-                channel_width,
-                ".6fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Channel Volume {colors.fg.lightgreen}[Vc] {colors.fg.darkgrey}::{colors.reset} ",
-                channel_volume,
-                ".6fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Channel Area {colors.fg.lightgreen}[Ac] {colors.fg.darkgrey}::{colors.reset} ",
-                channel_area,
-                ".6fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Hydraulic Diameter {colors.fg.lightgreen}[Dh] {colors.fg.darkgrey}::{colors.reset} ",
-                hydraulic_diameter,
-                ".6fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}U-value {colors.fg.lightgreen}[U] {colors.fg.darkgrey}::{colors.reset} ",
-                u_value,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Plate Surface Area {colors.fg.lightgreen}[As] {colors.fg.darkgrey}::{colors.reset}",
-                plate_surface_area,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Required Surface Area {colors.fg.lightgreen}[A] {colors.fg.darkgrey}::{colors.reset}",
-                required_surface_area,
-                ".3fP~",
-            )
-            pintil.mprint(
-                f"{colors.fg.blue}Plates Required {colors.fg.darkgrey}::{colors.reset}",
-                plates_required,
-                ".3fP~",
-            )
-            print(
-                f"{colors.fg.blue}Plates Used {colors.fg.darkgrey}::{colors.reset}",
-                plates_used,
-            )
-
-    if not solution_identified:
-        print(
-            f"\n{colors.underline}Hot Coolant :: {hot_coolant.name}{colors.reset}",
+        pintil.mprint(
+            _LABEL.format(name="Channel Velocity", sym="V"),
+            M_(hot_fluid_velocity, "m/s"),
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Reynolds Number", sym="Re"),
+            M_(hot_reynolds_number, ""),
+            ".0fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Nusselt Number", sym="Nu"),
+            M_(hot_nusselt_number, ""),
+            ".0fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Convective Coefficient", sym="h"),
+            M_(hot_convective_heat_transfer_coefficient, "W/m**2/delta_degC"),
+            ".0fP~",
+        )
+        print(_HEADING.format(f"Cold Coolant :: {cold_coolant.name}"))
+        pintil.mprint(
+            _LABEL.format(name="Inlet Temperature", sym="Ti"),
+            cold_coolant_inlet_temperature,
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Outlet Temperature", sym="To"),
+            cold_coolant_outlet_temperature,
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Delta Temperature", sym="ΔT"),
+            cold_coolant_delta_temperature,
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Max Velocity", sym="Vmax"),
+            max_cold_fluid_velocity,
+            ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Inlet Temperature {colors.fg.lightgreen}[Ti] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Channel Velocity", sym="V"),
+            M_(cold_fluid_velocity, "m/s"),
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Reynolds Number", sym="Re"),
+            M_(cold_reynolds_number, ""),
+            ".0fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Nusselt Number", sym="Nu"),
+            M_(cold_nusselt_number, ""),
+            ".0fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Convective Coefficient", sym="h"),
+            M_(cold_convective_heat_transfer_coefficient, "W/m**2/delta_degC"),
+            ".0fP~",
+        )
+        print(_HEADING.format(f"Heat Exchanger :: {heat_exchanger.get('name')}"))
+        pintil.mprint(
+            _LABEL.format(name="Energy Transfer", sym="Q"),
+            energy.to("kW"),
+            ".3fP~",
+        )
+        pintil.mprint(
+            _PLAIN_LABEL.format(name="LMTD"),
+            lmtd_cf,
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Channel Width", sym="Wc"),
+            channel_width,
+            ".6fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Channel Volume", sym="Vc"),
+            channel_volume,
+            ".6fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Channel Area", sym="Ac"),
+            channel_area,
+            ".6fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Hydraulic Diameter", sym="Dh"),
+            hydraulic_diameter,
+            ".6fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="U-value", sym="U"),
+            M_(u_value, "W/m**2/delta_degC"),
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Plate Surface Area", sym="As"),
+            plate_surface_area,
+            ".3fP~",
+        )
+        pintil.mprint(
+            _LABEL.format(name="Required Surface Area", sym="A"),
+            M_(required_surface_area, "m**2"),
+            ".3fP~",
+        )
+        pintil.mprint(
+            _PLAIN_LABEL.format(name="Plates Required"),
+            M_(plates_required, ""),
+            ".3fP~",
+        )
+        print(f"{_PLAIN_LABEL.format(name='Plates Used')}{plates_used}")
+
+    else:
+        print(_HEADING.format(f"Hot Coolant :: {hot_coolant.name}"))
+        pintil.mprint(
+            _LABEL.format(name="Inlet Temperature", sym="Ti"),
             hot_coolant_inlet_temperature,
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Outlet Temperature {colors.fg.lightgreen}[To] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Outlet Temperature", sym="To"),
             hot_coolant_outlet_temperature,
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Delta Temperature {colors.fg.lightgreen}[ΔT] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Delta Temperature", sym="ΔT"),
             hot_coolant_delta_temperature,
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Max Velocity {colors.fg.lightgreen}[Vmax] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Max Velocity", sym="Vmax"),
             max_hot_fluid_velocity,
             ".3fP~",
         )
-        print(
-            f"\n{colors.underline}Cold Coolant :: {cold_coolant.name}{colors.reset}",
-        )
+        print(_HEADING.format(f"Cold Coolant :: {cold_coolant.name}"))
         pintil.mprint(
-            f"{colors.fg.blue}Inlet Temperature {colors.fg.lightgreen}[Ti] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Inlet Temperature", sym="Ti"),
             cold_coolant_inlet_temperature,
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Outlet Temperature {colors.fg.lightgreen}[To] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Outlet Temperature", sym="To"),
             cold_coolant_outlet_temperature,
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Delta Temperature {colors.fg.lightgreen}[ΔT] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Delta Temperature", sym="ΔT"),
             cold_coolant_delta_temperature,
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Max Velocity {colors.fg.lightgreen}[Vmax] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Max Velocity", sym="Vmax"),
             max_cold_fluid_velocity,
             ".3fP~",
         )
-        print(
-            f"\n{colors.underline}Heat Exchanger :: {heat_exchanger.get('name')}{colors.reset}",
-        )
+        print(_HEADING.format(f"Heat Exchanger :: {heat_exchanger.get('name')}"))
         pintil.mprint(
-            f"{colors.fg.blue}Energy Transfer {colors.fg.lightgreen}[Q] {colors.fg.darkgrey}::{colors.reset} ",
-            energy,
+            _LABEL.format(name="Energy Transfer", sym="Q"),
+            energy.to("kW"),
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}LMTD {colors.fg.darkgrey}::{colors.reset} ",
+            _PLAIN_LABEL.format(name="LMTD"),
             lmtd_cf,
             ".3fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Channel Width {colors.fg.lightgreen}[Wc] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Channel Width", sym="Wc"),
             channel_width,
             ".6fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Channel Volume {colors.fg.lightgreen}[Vc] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Channel Volume", sym="Vc"),
             channel_volume,
             ".6fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Channel Area {colors.fg.lightgreen}[Ac] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Channel Area", sym="Ac"),
             channel_area,
             ".6fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Hydraulic Diameter {colors.fg.lightgreen}[Dh] {colors.fg.darkgrey}::{colors.reset} ",
+            _LABEL.format(name="Hydraulic Diameter", sym="Dh"),
             hydraulic_diameter,
             ".6fP~",
         )
         pintil.mprint(
-            f"{colors.fg.blue}Plate Surface Area {colors.fg.lightgreen}[As] {colors.fg.darkgrey}::{colors.reset}",
+            _LABEL.format(name="Plate Surface Area", sym="As"),
             plate_surface_area,
             ".3fP~",
         )
-        print(
-            f"{colors.fg.blue}Plates Required {colors.fg.darkgrey}::{colors.reset}",
-            f"{colors.fg.red}No Solution{colors.reset}",
-        )
+        print(f"{_PLAIN_LABEL.format(name='Plates Required')}{_NO_SOLUTION}")
 
 
 if __name__ == "__main__":
     # Load heat exchanger parameters
-    parameters = toml.load("data/parameters.toml")
+    with open("data/parameters.toml", "rb") as parameters_file:
+        parameters = tomllib.load(parameters_file)
     coolant_params = (
         "density",
         "dynamic_viscosity",
@@ -0,0 +1,26 @@
+"""Compiled array kernels for the coolant correlations"""
+
+import math
+
+from numba import float64, guvectorize
+
+from hx.fluids import _LAMINAR_FRICTION_5, _TURBULENT_FRICTION_5
+
+
+@guvectorize(
+    [(float64,) * 8 + (float64[:],)],
+    "(),(),(),(),(),(),(),()->()",
+    nopython=True,
+    target="parallel",
+)
+def convective_coefficient(rho, mu, k, pr, pr_term, u, dh, angle, out):
+    # pr_term is the Prandtl factor Pr**(2/3) - 1, hoisted by the caller
+    re = rho * u * dh / mu
+    # Compiled copy of hx.fluids._nusselt, keep the two in step
+    f8 = (
+        0.125
+        * (angle / 30) ** 0.83
+        * (_LAMINAR_FRICTION_5 / re**5 + _TURBULENT_FRICTION_5 / re**2.5) ** 0.2
+    )
+    nu = (f8 * (re - 1000) * pr) / (1 + 12.7 * math.sqrt(f8) * pr_term)
+    out[0] = nu * k / dh
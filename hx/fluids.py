@@ -1,11 +1,54 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from typing import Callable, Iterable, Union
 
-from pint import Measurement
+import numpy as np
+from pint import Measurement, Quantity
+from uncertainties import UFloat, nominal_value, ufloat, unumpy
 
 from hx import pintil
+from hx.pintil import Q_, U_
 
+# Friction factor constants, raised to the fifth power once at import
+_LAMINAR_FRICTION_5 = 30.2**5
+_TURBULENT_FRICTION_5 = 6.28**5
 
-@dataclass
+
+def _friction_prefactor(corregation_angle: float) -> float:
+    # Corrugation angle factor of the friction correlation
+    return 0.125 * (corregation_angle / 30) ** 0.83
+
+
+def _nusselt(re, friction, pr, pr_term):
+    # Corrugated-plate friction and Nusselt correlation on float or ufloat
+    # magnitudes, or object arrays of them. The numba kernel repeats it.
+    f8 = (
+        friction
+        * (_LAMINAR_FRICTION_5 / re**5 + _TURBULENT_FRICTION_5 / re**2.5) ** 0.2
+    )
+    # **0.5 rather than a sqrt function, so one expression serves every type
+    return (f8 * (re - 1000) * pr) / (1 + 12.7 * f8**0.5 * pr_term)
+
+
+# Units of the method inputs and results, parsed once at import
+_WATT = U_("W")
+_KG_PER_S = U_("kg/s")
+_M_PER_S = U_("m/s")
+_METRE = U_("m")
+_DIMENSIONLESS = U_("dimensionless")
+_KELVIN = U_("kelvin")
+_HTC = U_("W/m**2/delta_degC")
+
+# Cached SI magnitude attributes and the parameter fields they are parsed from
+_PROPERTIES = {
+    "_rho": "density",
+    "_mu": "dynamic_viscosity",
+    "_pr": "prandtl_number",
+    "_cp": "specific_heat",
+    "_k": "thermal_conductivity",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Coolant:
     density: str
     dynamic_viscosity: str
@@ -14,65 +57,192 @@ class Coolant:
     specific_heat: str
     thermal_conductivity: str
 
+    # Coolant property magnitudes parsed once into SI base units, as plain
+    # floats unless the parameter carries an uncertainty
+    _rho: Union[float, UFloat] = field(init=False, repr=False, compare=False)
+    _mu: Union[float, UFloat] = field(init=False, repr=False, compare=False)
+    _pr: Union[float, UFloat] = field(init=False, repr=False, compare=False)
+    _cp: Union[float, UFloat] = field(init=False, repr=False, compare=False)
+    _k: Union[float, UFloat] = field(init=False, repr=False, compare=False)
+    _pr_term: Union[float, UFloat] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._cache_properties(
+            pintil.quantity_or_measurement(getattr(self, prop))
+            .to_base_units()
+            .magnitude
+            for prop in _PROPERTIES.values()
+        )
+
+    def _cache_properties(self, magnitudes: Iterable[Union[float, UFloat]]) -> None:
+        # Frozen instance, so the cache is filled past the dataclass __setattr__
+        for name, magnitude in zip(_PROPERTIES, magnitudes):
+            object.__setattr__(self, name, magnitude)
+        object.__setattr__(self, "_pr_term", self._pr ** (2 / 3) - 1)
+
+    @classmethod
+    def from_dict_batch(cls, params: list[dict[str, str]]) -> list["Coolant"]:
+        """Build coolants from parameter tables, parsing each property column once."""
+
+        if not params:
+            return []
+
+        si_columns = []
+        for prop in _PROPERTIES.values():
+            values, errors, units = pintil.mtargs_batch([p[prop] for p in params])
+            # One pint conversion per distinct unit string in the column
+            unique_units, inverse = np.unique(units, return_inverse=True)
+            factors = np.array(
+                [Q_(1.0, u).to_base_units().magnitude for u in unique_units]
+            )[inverse]
+            si_columns.append(
+                zip((values * factors).tolist(), (errors * factors).tolist())
+            )
+
+        coolants = []
+        for p, si_row in zip(params, zip(*si_columns)):
+            coolant = object.__new__(cls)
+            for f in fields(cls):
+                if f.init:
+                    object.__setattr__(coolant, f.name, p[f.name])
+            coolant._cache_properties(
+                ufloat(value, error) if error else value for value, error in si_row
+            )
+            coolants.append(coolant)
+
+        return coolants
+
+    @property
+    def rho(self) -> Union[float, UFloat]:
+        """Density in kg/m**3."""
+        return self._rho
+
+    @property
+    def mu(self) -> Union[float, UFloat]:
+        """Dynamic viscosity in Pa*s."""
+        return self._mu
+
+    @property
+    def pr(self) -> Union[float, UFloat]:
+        """Prandtl number."""
+        return self._pr
+
+    @property
+    def cp(self) -> Union[float, UFloat]:
+        """Specific heat in J/(kg*K)."""
+        return self._cp
+
+    @property
+    def k(self) -> Union[float, UFloat]:
+        """Thermal conductivity in W/(m*K)."""
+        return self._k
+
     def temperature_change(
         self,
-        energy_transfer: str,
-        mass_flow_rate: str,
-    ) -> str:
-        M_ = Measurement
-
-        delta_temperature = (
-            M_(*pintil.mtargs(energy_transfer)).to_root_units()
-            / M_(*pintil.mtargs(mass_flow_rate)).to_root_units()
-            / M_(*pintil.mtargs(self.specific_heat)).to_root_units()
-        ).to("kelvin")
-        return f"{delta_temperature:C}"
+        energy_transfer: Union[Quantity, Measurement],
+        mass_flow_rate: Union[Quantity, Measurement],
+    ) -> Union[Quantity, Measurement]:
+        q = pintil.magnitude_as(energy_transfer, _WATT)
+        mdot = pintil.magnitude_as(mass_flow_rate, _KG_PER_S)
 
-    def reynolds_number(
+        return pintil.wrap(q / mdot / self._cp, _KELVIN)
+
+    def temperature_change_array(
         self,
-        fluid_velocity: str,
-        hydraulic_diameter: str,
-    ) -> str:
-        M_ = Measurement
+        energy_transfer: Union[Quantity, np.ndarray],
+        mass_flow_rate: Union[Quantity, np.ndarray],
+    ) -> Quantity:
+        # Bare arrays are taken to be in W and kg/s
+        if isinstance(energy_transfer, Quantity):
+            energy_transfer = pintil.magnitude_as(energy_transfer, _WATT)
+        if isinstance(mass_flow_rate, Quantity):
+            mass_flow_rate = pintil.magnitude_as(mass_flow_rate, _KG_PER_S)
 
-        u = M_(*pintil.mtargs(fluid_velocity)).to_root_units()
-        dh = M_(*pintil.mtargs(hydraulic_diameter)).to_root_units()
-        rho = M_(*pintil.mtargs(self.density)).to_root_units()
-        mu = M_(*pintil.mtargs(self.dynamic_viscosity)).to_root_units()
-        re = rho * u * dh / mu
+        delta_t = np.divide(energy_transfer, mass_flow_rate) / nominal_value(self._cp)
 
-        return f"{re:C}"
+        return Q_(delta_t, _KELVIN)
+
+    def reynolds_number(
+        self,
+        fluid_velocity: Union[Quantity, Measurement],
+        hydraulic_diameter: Union[Quantity, Measurement],
+    ) -> Union[Quantity, Measurement]:
+        u = pintil.magnitude_as(fluid_velocity, _M_PER_S)
+        dh = pintil.magnitude_as(hydraulic_diameter, _METRE)
+
+        return pintil.wrap(self._rho * u * dh / self._mu, _DIMENSIONLESS)
 
     def nusselt_number(
         self,
-        reynolds_number: str,
+        reynolds_number: Union[Quantity, Measurement],
         corregation_angle: float,
-    ) -> str:
-        M_ = Measurement
-
-        re = M_(*pintil.mtargs(reynolds_number)).to_root_units()
-        pr = M_(*pintil.mtargs(self.prandtl_number)).to_root_units()
+    ) -> Union[Quantity, Measurement]:
+        re = pintil.magnitude_as(reynolds_number, _DIMENSIONLESS)
 
-        f = (corregation_angle / 30) ** 0.83 * (
-            (30.2 / re) ** 5 + (6.28 / re**0.5) ** 5
-        ) ** 0.2
-        nu = ((f / 8) * (re - 1000) * pr) / (
-            1 + 12.7 * (f / 8) ** 0.5 * (pr ** (2 / 3) - 1)
+        nu = _nusselt(
+            re, _friction_prefactor(corregation_angle), self._pr, self._pr_term
         )
 
-        return f"{nu:C}"
+        return pintil.wrap(nu, _DIMENSIONLESS)
 
     def convective_coefficient(
         self,
-        nusselt_number: str,
-        hydraulic_diameter: str,
-    ) -> str:
-        M_ = Measurement
+        nusselt_number: Union[Quantity, Measurement],
+        hydraulic_diameter: Union[Quantity, Measurement],
+    ) -> Union[Quantity, Measurement]:
+        nu = pintil.magnitude_as(nusselt_number, _DIMENSIONLESS)
+        dh = pintil.magnitude_as(hydraulic_diameter, _METRE)
 
-        nu = M_(*pintil.mtargs(nusselt_number)).to_root_units()
-        dh = M_(*pintil.mtargs(hydraulic_diameter)).to_root_units()
-        k = M_(*pintil.mtargs(self.thermal_conductivity)).to_root_units()
+        return pintil.wrap(nu * self._k / dh, _HTC)
 
-        h = (nu * k / dh).to("W/m**2/degC")
+    def h_array(
+        self,
+        fluid_velocity: Quantity,
+        hydraulic_diameter: Quantity,
+        corregation_angle: float,
+    ) -> Quantity:
+        # Deferred so the CLI does not pay the numba import on every run
+        from hx._kernels import convective_coefficient
+
+        # Measurement inputs are reduced to their nominal values
+        u = np.asarray(
+            unumpy.nominal_values(pintil.magnitude_as(fluid_velocity, _M_PER_S)),
+            dtype=float,
+        )
+        dh = np.asarray(
+            unumpy.nominal_values(pintil.magnitude_as(hydraulic_diameter, _METRE)),
+            dtype=float,
+        )
+
+        h = convective_coefficient(
+            nominal_value(self._rho),
+            nominal_value(self._mu),
+            nominal_value(self._k),
+            nominal_value(self._pr),
+            nominal_value(self._pr_term),
+            u,
+            dh,
+            corregation_angle,
+        )
 
-        return f"{h:C}"
+        return Q_(h, _HTC)
+
+    def compile_h(
+        self,
+        hydraulic_diameter: Union[Quantity, Measurement],
+        corregation_angle: float,
+    ) -> Callable[[float], float]:
+        # Fold everything but the velocity into constants for solver loops,
+        # taking and returning nominal SI floats (m/s -> W/m**2/K)
+        dh = nominal_value(pintil.magnitude_as(hydraulic_diameter, _METRE))
+        re_per_velocity = nominal_value(self._rho) * dh / nominal_value(self._mu)
+        friction = _friction_prefactor(corregation_angle)
+        pr = nominal_value(self._pr)
+        pr_term = nominal_value(self._pr_term)
+        h_per_nusselt = nominal_value(self._k) / dh
+
+        def h(fluid_velocity: float) -> float:
+            re = re_per_velocity * fluid_velocity
+            return h_per_nusselt * _nusselt(re, friction, pr, pr_term)
+
+        return h
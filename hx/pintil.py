@@ -1,37 +1,190 @@
-from pint import Measurement
+from functools import lru_cache, singledispatch
+from typing import Union
 
+import numpy as np
+from pint import Measurement, Quantity, Unit, UnitRegistry, set_application_registry
+from uncertainties import UFloat
 
-def mtargs(__arg: str, /) -> tuple:
+# Single unit registry for the package, with pint's on-disk definitions cache
+_UREG = UnitRegistry(cache_folder=":auto:")
+set_application_registry(_UREG)
+Q_ = _UREG.Quantity
+M_ = _UREG.Measurement
+U_ = _UREG.Unit
+
+# Coolant property units with a fixed id, for struct-of-arrays parsing
+_UNIT_TABLE = {
+    units: unit_id
+    for unit_id, units in enumerate(
+        (
+            "dimensionless",
+            "kg/m**3",
+            "g/cm**3",
+            "kg/(m*s)",
+            "Pa*s",
+            "cP",
+            "J/(kg*°C)",
+            "J/(kg*K)",
+            "kJ/(kg*K)",
+            "W/(m*°C)",
+            "W/(m*K)",
+        )
+    )
+}
+# SI conversion factor of each unit id, indexable from compiled kernels
+UNIT_FACTORS = np.array(
+    [Q_(1.0, units).to_base_units().magnitude for units in _UNIT_TABLE]
+)
+
+# Unit formatting flags understood by pint, as opposed to magnitude codes
+_UNIT_FLAGS = "~PLHCD"
+
+
+@singledispatch
+def mtargs(__arg, /) -> tuple:
     """Convert string into tuple of arguments for pint Measurement.
 
     Args:
-        __arg: Formatted string for pint.
+        __arg: Formatted string for pint, or an already parsed tuple.
 
     Returns:
         tuple: (value, error, units)
     """
 
+    raise TypeError(f"cannot parse measurement from {type(__arg).__name__}")
+
+
+@mtargs.register(tuple)
+def _(__arg: tuple, /) -> tuple:
+    # Already parsed, e.g. passed along a pipeline of calculations
+    return __arg
+
+
+@mtargs.register(str)
+@lru_cache(maxsize=8192)
+def _(__arg: str, /) -> tuple:
     value, units = __arg.rsplit(" ", 1)
+    index, width = value.find("+/-"), 3
+    if index == -1:
+        index, width = value.find("±"), 1
+        if index == -1:
+            return float(value), 0.0, units
+
+    # A trailing power, as in "(1.2 ± 0.1)e+03", applies to value and error
+    uncertainty, e, power = value[index + width :].partition("e")
+    power = e + power
     try:
-        return float(value), 0.0, units
-    except ValueError:
-        if "e+" in value:
-            value, power = value.split("e+")
-            power = "e+" + power
-        elif "e-" in value:
-            value, power = value.split("e-")
-            power = "e-" + power
-        else:
-            power = "e+0"
-        try:
-            value, uncertainty = value.split("+/-", 1)
-        except ValueError:
-            value, uncertainty = value.split("±", 1)
         return (
-            float(value.strip("( ") + f"{power}"),
-            float(uncertainty.strip(" )") + f"{power}"),
+            float(value[:index].strip("( ") + power),
+            float(uncertainty.strip(" )") + power),
             units,
         )
+    except ValueError:
+        raise ValueError(f"could not parse measurement {__arg!r}") from None
+
+
+def mtargs_batch(__arr, /) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert an array of strings into arrays of arguments for pint Measurement.
+
+    Args:
+        __arr: Array-like of formatted strings for pint.
+
+    Returns:
+        tuple: (values, errors, units) arrays shaped like the input.
+    """
+
+    arr = np.asarray(__arr, dtype=str)
+    if arr.size == 0:
+        # np.char.rpartition cannot size its output for an empty array
+        return np.empty(arr.shape), np.zeros(arr.shape), np.empty(arr.shape, dtype=str)
+
+    parts = np.char.rpartition(arr, " ")
+    values, units = parts[..., 0], parts[..., 2]
+
+    # Plain values convert in one pass, uncertain ones go through mtargs
+    uncertain = (np.char.find(values, "+/-") >= 0) | (np.char.find(values, "±") >= 0)
+    out_values = np.empty(arr.shape)
+    out_errors = np.zeros(arr.shape)
+    out_values[~uncertain] = values[~uncertain].astype(float)
+    for index in map(tuple, np.argwhere(uncertain)):
+        out_values[index], out_errors[index], _ = mtargs(str(arr[index]))
+
+    return out_values, out_errors, units
+
+
+def mtargs_to_soa(__arr, /) -> tuple[np.ndarray, np.ndarray]:
+    """Convert an array of strings into nominal values and unit ids.
+
+    Args:
+        __arr: Array-like of formatted strings for pint, in units from the
+            unit table.
+
+    Returns:
+        tuple: (values, unit_ids) where values * UNIT_FACTORS[unit_ids] is SI.
+    """
+
+    values, _, units = mtargs_batch(__arr)
+    try:
+        unit_ids = np.array(
+            [_UNIT_TABLE[str(u)] for u in units.flat], dtype=np.int8
+        ).reshape(units.shape)
+    except KeyError as error:
+        raise ValueError(f"units {error} are not in the unit table") from None
+
+    return values, unit_ids
+
+
+def quantity_or_measurement(
+    __arg: Union[str, tuple], /
+) -> Union[Quantity, Measurement]:
+    """Convert string into a pint Quantity, or a Measurement if it has an error.
+
+    Args:
+        __arg: Formatted string for pint, or an already parsed tuple.
+
+    Returns:
+        Union[Quantity, Measurement]: Quantity when the error is zero.
+    """
+
+    value, error, units = mtargs(__arg)
+    if error == 0.0:
+        return Q_(value, units)
+    return M_(value, error, units)
+
+
+def magnitude_as(
+    quantity: Union[Quantity, Measurement], units: Unit
+) -> Union[float, UFloat, np.ndarray]:
+    """Get the magnitude of a pint Quantity or Measurement in the given units.
+
+    Args:
+        quantity: Quantity or Measurement to convert.
+        units: Target units, parsed ahead of time.
+
+    Returns:
+        Union[float, UFloat, np.ndarray]: Magnitude in units, converted only
+        when the quantity is not already in them.
+    """
+
+    if quantity.units == units:
+        return quantity.magnitude
+    return quantity.m_as(units)
+
+
+def wrap(magnitude, units: Union[str, Unit]) -> Union[Quantity, Measurement]:
+    """Attach units to a magnitude, keeping any uncertainty it carries.
+
+    Args:
+        magnitude: Float or ufloat magnitude.
+        units: Units to attach.
+
+    Returns:
+        Union[Quantity, Measurement]: Measurement when magnitude is a ufloat.
+    """
+
+    if isinstance(magnitude, UFloat):
+        return M_(magnitude, units)
+    return Q_(magnitude, units)
 
 
 def mprint(text: str, measurement: Measurement, fmt: str = "P~") -> None:
@@ -43,11 +196,9 @@ def mprint(text: str, measurement: Measurement, fmt: str = "P~") -> None:
         fmt: Quantity formatting code. Defaults to "P~".
     """
 
-    try:
-        _, units = f"{measurement.value:{fmt}}".rsplit(" ", 1)
+    # Only the units are formatted a second time, using the unit flags of fmt
+    units = f"{measurement.units:{''.join(c for c in fmt if c in _UNIT_FLAGS)}}"
+    if units:
         units = f" {units}"
-    except ValueError:
-        # ValueError indicates that units are missing
-        units = ""
     value, _ = f"{measurement:{fmt.replace('~','')}}".rsplit(" ", 1)
     print(f"{text}{value}{units}")